@@ -10,76 +10,341 @@ Features:
 - Agent evaluation framework
 """
 
-import json
+import atexit
 import logging
+import os
+import queue
+import sys
+import threading
 import time
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from threading import Thread
+
+try:
+    from orjson import dumps as _json_dumps  # serializes straight to bytes
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
+from dataclasses import dataclass
+from enum import IntEnum
 
 
 # ==================== OBSERVABILITY ====================
 
-class LogLevel(Enum):
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    DEBUG = "DEBUG"
+class LogLevel(IntEnum):
+    INFO = 0
+    WARNING = 1
+    ERROR = 2
+    DEBUG = 3
+
+
+# Agent and action names form a small fixed vocabulary; interning them lets
+# dict lookups and comparisons take the pointer-equality fast path and keeps
+# a single copy of each string alive across all traces
+_KNOWN_NAMES = (
+    "CoordinatorAgent", "ResearcherAgent", "SynthesizerAgent",
+    "WebSearchTool", "SynthesisTool", "ResearchAgentSystem", "AgentEvaluator",
+    "task_started", "task_completed",
+    "search_initiated", "search_completed", "search_cache_hit",
+    "research_started", "research_completed", "research_plan_created",
+    "synthesis_started", "synthesis_completed", "evaluation_completed",
+)
+for _name in _KNOWN_NAMES:
+    sys.intern(_name)
+
+
+# Action kind codes kept alongside each trace so aggregations can run on
+# typed arrays instead of re-checking action strings
+ACTION_STARTED = 0
+ACTION_COMPLETED = 1
+ACTION_OTHER = 2
+
+_NAN = float("nan")
+
+# Timestamps are needed as strings up front (they go straight into the trace
+# line), so the second-resolution prefix is cached and only the microseconds
+# are formatted per call instead of re-running datetime.isoformat every time
+_ts_second = 0
+_ts_prefix = ""
+
+
+def _fast_isoformat() -> str:
+    """ISO-8601 timestamp with the per-second prefix cached between calls"""
+    global _ts_second, _ts_prefix
+    second, ns = divmod(time.time_ns(), 1_000_000_000)
+    if second != _ts_second:
+        # Publish the prefix before the second marker: log() calls this
+        # from several threads, and a concurrent caller that sees a
+        # matching second must never pick up a stale prefix
+        _ts_prefix = datetime.fromtimestamp(second).isoformat()
+        _ts_second = second
+    return f"{_ts_prefix}.{ns // 1000:06d}"
+
+
+def _reduce_traces(durations, action_kinds, indices):
+    """Sum durations and count completed tasks for the selected traces"""
+    total_time = 0.0
+    completed = 0
+    for i in indices:
+        if action_kinds[i] == ACTION_COMPLETED:
+            completed += 1
+        duration = durations[i]
+        if duration == duration:  # NaN marks traces without a duration
+            total_time += duration
+    return total_time, completed
+
+
+# numpy/numba are optional accelerators for the reduction above, resolved
+# on the first evaluation rather than at module scope: importing numba
+# costs on the order of a second when installed, which should not be paid
+# just for importing this module
+_reduce_np = None
+_reduce_impl = None
+
+
+def _reduce_session_traces(durations, action_kinds, indices):
+    """Run the trace reduction, JIT-compiling it on first use if possible"""
+    global _reduce_np, _reduce_impl
+    if _reduce_impl is None:
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            _reduce_impl = _reduce_traces
+        else:
+            _reduce_np = numpy
+            _reduce_impl = njit(cache=True)(_reduce_traces)
+    np = _reduce_np
+    if np is not None:
+        return _reduce_impl(
+            np.frombuffer(durations),
+            np.frombuffer(action_kinds, dtype=np.int8),
+            np.asarray(indices, dtype=np.int64),
+        )
+    return _reduce_impl(durations, action_kinds, indices)
+
+
+# Agent/action names come from a small fixed vocabulary, so their JSON
+# encodings are cached instead of re-serialized on every log call
+_JSON_FRAGMENTS: Dict[str, bytes] = {}
+
+
+def _json_fragment(value: str) -> bytes:
+    frag = _JSON_FRAGMENTS.get(value)
+    if frag is None:
+        frag = _JSON_FRAGMENTS[value] = _json_dumps(value)
+    return frag
+
+
+def _serialize_trace(timestamp: str, agent: str, action: str, details_json: bytes) -> bytes:
+    """Assemble one trace as a JSON object from pre-encoded pieces"""
+    return (
+        b'{"timestamp":' + _json_dumps(timestamp)
+        + b',"agent":' + _json_fragment(agent)
+        + b',"action":' + _json_fragment(action)
+        + b',"details":' + details_json + b'}'
+    )
 
 
 class AgentLogger:
     """Centralized logging and tracing for all agents"""
-    
-    def __init__(self, log_file: str = "agent_traces.log"):
+
+    __slots__ = (
+        "log_file", "max_traces", "ts", "agents", "actions", "details",
+        "action_kinds", "durations", "by_session",
+        "_log_fd", "_buffer", "_lock", "logger", "_log_funcs", "_listener",
+    )
+
+    # Bytes buffered in memory before hitting the disk
+    FLUSH_THRESHOLD = 64 * 1024
+
+    def __init__(self, log_file: str = "agent_traces.log", max_traces: int = 100_000):
         self.log_file = log_file
-        self.traces = []
-        
-        # Setup file logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger("ResearchAgent")
-    
-    def log(self, agent_name: str, action: str, details: Dict[str, Any], level: LogLevel = LogLevel.INFO):
+        # In-memory traces are bounded: once the columns exceed max_traces,
+        # the oldest rows are evicted (they remain in the trace file)
+        self.max_traces = max_traces
+
+        # Traces are stored column-wise (structure-of-arrays): one parallel
+        # list per field instead of a dict per entry. Appends allocate no
+        # dicts and scans in the evaluator touch only the columns they need
+        self.ts: List[str] = []
+        self.agents: List[str] = []
+        self.actions: List[str] = []
+        self.details: List[Dict[str, Any]] = []
+        # Numeric side columns for the evaluator: action kind codes and
+        # durations (NaN where a trace carries no duration), kept as typed
+        # arrays so the reduction never touches Python objects
+        self.action_kinds = array('b')
+        self.durations = array('d')
+        # session_id -> indices into the columns, so per-session evaluation
+        # reads only that session's traces instead of scanning everything
+        self.by_session: Dict[str, List[int]] = defaultdict(list)
+
+        # Raw append-only fd for the trace file: log lines accumulate in an
+        # in-memory buffer and are flushed with a single os.write, so the hot
+        # path pays one syscall per ~64 KB instead of one per log call
+        self._log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._buffer = bytearray()
+        # log() is called from the search pool and the pipeline stage
+        # threads, so every mutation of the columns, the session index,
+        # and the write buffer happens under this lock
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+        # Console logging is configured lazily on the first log() call so
+        # constructing a logger does no handler setup or I/O
+        self.logger = None
+        self._log_funcs = None
+        self._listener = None
+
+    def _ensure_logging(self):
+        """Set up the console echo on first use (idempotent, thread-safe)
+
+        Records go through a QueueHandler, so the hot path only enqueues;
+        a background QueueListener owns the StreamHandler (and its lock)
+        and drains the queue off the critical path.
+        """
+        with self._lock:
+            # Re-check under the lock: two threads can both see
+            # _log_funcs is None on their first log() call
+            if self._log_funcs is not None:
+                return
+            logger = logging.getLogger("ResearchAgent")
+            if not logger.handlers:
+                stream_handler = logging.StreamHandler()
+                stream_handler.setFormatter(logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                ))
+                log_queue = queue.SimpleQueue()
+                self._listener = QueueListener(log_queue, stream_handler)
+                self._listener.start()
+                atexit.register(self._listener.stop)
+                logger.addHandler(QueueHandler(log_queue))
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+            self.logger = logger
+            # Indexed by LogLevel so log() dispatches without an if/elif
+            # ladder; assigned last so a concurrent fast-path check only
+            # sees a fully built dispatch table
+            self._log_funcs = (
+                logger.info, logger.warning,
+                logger.error, logger.debug,
+            )
+
+    def log(self, agent_name: str, action: str, details: Dict[str, Any],
+            level: LogLevel = LogLevel.INFO, session_id: Optional[str] = None):
         """Log agent actions with full tracing"""
-        trace_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "agent": agent_name,
-            "action": action,
-            "details": details
-        }
-        self.traces.append(trace_entry)
-        
-        log_message = f"[{agent_name}] {action}: {json.dumps(details)}"
-        
-        if level == LogLevel.INFO:
-            self.logger.info(log_message)
-        elif level == LogLevel.WARNING:
-            self.logger.warning(log_message)
-        elif level == LogLevel.ERROR:
-            self.logger.error(log_message)
-        elif level == LogLevel.DEBUG:
-            self.logger.debug(log_message)
-    
+        timestamp = _fast_isoformat()
+        if action.endswith("_completed"):
+            kind = ACTION_COMPLETED
+        elif action.endswith("_started"):
+            kind = ACTION_STARTED
+        else:
+            kind = ACTION_OTHER
+        duration = details.get("duration_seconds")
+
+        # Serialize once to bytes and write the trace file as JSON lines;
+        # the decoded details are reused for the console message
+        details_json = _json_dumps(details)
+        log_message = f"[{agent_name}] {action}: {details_json.decode()}"
+        payload = _serialize_trace(timestamp, agent_name, action, details_json)
+
+        with self._lock:
+            self.ts.append(timestamp)
+            self.agents.append(agent_name)
+            self.actions.append(action)
+            self.details.append(details)
+            self.action_kinds.append(kind)
+            self.durations.append(duration if duration is not None else _NAN)
+            if session_id is not None:
+                self.by_session[session_id].append(len(self.actions) - 1)
+            if len(self.actions) > self.max_traces:
+                self._evict()
+            self._buffer += payload
+            self._buffer += b'\n'
+            must_flush = level is LogLevel.ERROR or len(self._buffer) >= self.FLUSH_THRESHOLD
+        if must_flush:
+            self.flush()
+
+        if self._log_funcs is None:
+            self._ensure_logging()
+        self._log_funcs[level](log_message)
+
+    def _evict(self):
+        """Drop the oldest traces so the columns stay within max_traces
+
+        Eviction removes a block (an eighth of the capacity) at a time so
+        the O(n) front deletion amortizes to O(1) per log call, then shifts
+        the per-session indices to match the surviving rows. The caller
+        must hold self._lock.
+        """
+        drop = len(self.actions) - self.max_traces + self.max_traces // 8
+        del self.ts[:drop]
+        del self.agents[:drop]
+        del self.actions[:drop]
+        del self.details[:drop]
+        del self.action_kinds[:drop]
+        del self.durations[:drop]
+        for sid in list(self.by_session):
+            kept = [i - drop for i in self.by_session[sid] if i >= drop]
+            if kept:
+                self.by_session[sid] = kept
+            else:
+                del self.by_session[sid]
+
+    def flush(self):
+        """Write buffered log lines to the trace file"""
+        with self._lock:
+            if not self._buffer:
+                return
+            # Write from an immutable copy: a memoryview of the live
+            # buffer would forbid concurrent appends from resizing it
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            # os.write may accept fewer bytes than offered, so loop
+            # until the whole batch is on disk
+            while data:
+                written = os.write(self._log_fd, data)
+                data = data[written:]
+
     def get_traces(self) -> List[Dict[str, Any]]:
-        """Retrieve all traces for analysis"""
-        return self.traces
-    
+        """Retrieve all traces as dicts (materialized lazily from the columns)"""
+        with self._lock:
+            return [
+                {"timestamp": ts, "agent": agent, "action": action, "details": details}
+                for ts, agent, action, details in zip(self.ts, self.agents, self.actions, self.details)
+            ]
+
     def export_traces(self, filename: str = "trace_export.json"):
-        """Export traces to JSON file"""
-        with open(filename, 'w') as f:
-            json.dump(self.traces, f, indent=2)
+        """Export traces to JSON file in one buffered write"""
+        self.flush()
+        # Serialize rows straight from the columns into a single buffer,
+        # avoiding both the dict materialization of get_traces() and the
+        # small chunked writes of an incremental dump
+        buf = bytearray(b'[')
+        with self._lock:
+            for i, (ts, agent, action, details) in enumerate(
+                    zip(self.ts, self.agents, self.actions, self.details)):
+                if i:
+                    buf += b','
+                buf += _serialize_trace(ts, agent, action, _json_dumps(details))
+        buf += b']\n'
+        with open(filename, 'wb') as f:
+            f.write(memoryview(buf))
 
 
 # ==================== MEMORY & SESSIONS ====================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResearchContext:
     """Context object for research sessions"""
     query: str
@@ -118,31 +383,44 @@ class InMemorySessionService:
         if not history:
             return "No previous research in this session."
         
-        summary = f"Previous research in this session ({len(history)} queries):\n"
+        parts = [f"Previous research in this session ({len(history)} queries):\n"]
         for i, ctx in enumerate(history[-3:], 1):  # Last 3 for context compaction
-            summary += f"{i}. {ctx.query}: {ctx.synthesis[:100]}...\n"
-        return summary
+            parts.append(f"{i}. {ctx.query}: {ctx.synthesis[:100]}...\n")
+        return "".join(parts)
 
 
 class MemoryBank:
-    """Long-term memory across sessions"""
-    
+    """Long-term memory across sessions
+
+    Per-topic insights and learned patterns are bounded deques: the oldest
+    entries are evicted once the limit is hit, so long-running deployments
+    cannot grow memory without bound.
+    """
+
+    MAX_INSIGHTS_PER_TOPIC = 32
+    MAX_PATTERNS = 256
+
     def __init__(self):
         self.knowledge_base: Dict[str, Any] = {}
-        self.research_patterns: List[str] = []
-    
+        self.research_patterns: deque = deque(maxlen=self.MAX_PATTERNS)
+
     def store_insight(self, topic: str, insight: str):
         """Store insights for long-term retrieval"""
-        if topic not in self.knowledge_base:
-            self.knowledge_base[topic] = []
-        self.knowledge_base[topic].append({
-            "insight": insight,
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    def retrieve_insights(self, topic: str) -> List[str]:
-        """Retrieve relevant insights from memory"""
-        return [item["insight"] for item in self.knowledge_base.get(topic, [])]
+        entry = self.knowledge_base.get(topic)
+        if entry is None:
+            # Parallel insight/timestamp columns; both share a maxlen so
+            # they evict in lockstep
+            entry = self.knowledge_base[topic] = {
+                "insights": deque(maxlen=self.MAX_INSIGHTS_PER_TOPIC),
+                "timestamps": deque(maxlen=self.MAX_INSIGHTS_PER_TOPIC),
+            }
+        entry["insights"].append(insight)
+        entry["timestamps"].append(time.time_ns())
+
+    def retrieve_insights(self, topic: str) -> deque:
+        """Retrieve relevant insights from memory (a live view, not a copy)"""
+        entry = self.knowledge_base.get(topic)
+        return entry["insights"] if entry is not None else deque()
     
     def add_research_pattern(self, pattern: str):
         """Learn from research patterns"""
@@ -153,17 +431,35 @@ class MemoryBank:
 
 class WebSearchTool:
     """Custom web search tool (simulated for demo)"""
-    
-    def __init__(self, logger: AgentLogger):
+
+    def __init__(self, logger: AgentLogger, cache_enabled: bool = True, cache_ttl: float = 300.0):
         self.logger = logger
-    
+        # Repeated queries within a session hit this cache instead of the
+        # network; disable (or lower the TTL) where freshness matters
+        self.cache_enabled = cache_enabled
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[tuple, tuple] = {}
+
     def search(self, query: str, num_results: int = 5) -> List[Dict[str, str]]:
         """Perform web search and return results"""
+        cache_key = (query.lower().strip(), num_results)
+        if self.cache_enabled:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                cached_at, results = cached
+                if time.monotonic() - cached_at < self.cache_ttl:
+                    self.logger.log("WebSearchTool", "search_cache_hit", {
+                        "query": query
+                    })
+                    # Copy each record so callers that mutate a result
+                    # cannot poison the cache for later hits
+                    return [result.copy() for result in results]
+
         self.logger.log("WebSearchTool", "search_initiated", {
             "query": query,
             "num_results": num_results
         })
-        
+
         # In production, integrate with real search API
         # For demo, return structured mock results
         results = [
@@ -178,70 +474,112 @@ class WebSearchTool:
         self.logger.log("WebSearchTool", "search_completed", {
             "results_count": len(results)
         })
-        
+
+        if self.cache_enabled:
+            # Cache copies, not the dicts handed to the caller: the first
+            # caller mutating its results must not poison later hits either
+            self._cache[cache_key] = (time.monotonic(),
+                                      tuple(result.copy() for result in results))
+
         return results
 
+    def batch_search(self, queries: List[str], num_results: int = 5) -> List[List[Dict[str, str]]]:
+        """Run several searches concurrently, one result list per query
+
+        Searches are I/O-bound, so issuing them from a small thread pool
+        overlaps their latency. A real backend can override this to coalesce
+        the batch into a single API round-trip.
+        """
+        if len(queries) <= 1:
+            return [self.search(q, num_results) for q in queries]
+        with ThreadPoolExecutor(max_workers=min(len(queries), 4)) as pool:
+            return list(pool.map(lambda q: self.search(q, num_results), queries))
+
+
+# The synthesis output has a fixed shape (header plus up to three numbered
+# lines), so one template per finding count is built at import time and
+# filled with a single format call instead of a Python-level loop
+_SYNTHESIS_TMPLS = tuple(
+    "Based on {n} sources, the key insights are:\n"
+    + "".join(f"{i}. {{f[{i - 1}]}}\n" for i in range(1, k + 1))
+    for k in range(4)
+)
+
 
 class SynthesisTool:
     """Custom tool for synthesizing information"""
-    
+
     def __init__(self, logger: AgentLogger):
         self.logger = logger
-    
+
     def synthesize(self, findings: List[str]) -> str:
         """Synthesize multiple findings into coherent summary"""
         self.logger.log("SynthesisTool", "synthesis_started", {
             "findings_count": len(findings)
         })
-        
+
         # In production, use LLM for synthesis
-        synthesis = f"Based on {len(findings)} sources, the key insights are:\n"
-        for i, finding in enumerate(findings[:3], 1):
-            synthesis += f"{i}. {finding}\n"
-        
-        return synthesis
+        tmpl = _SYNTHESIS_TMPLS[min(len(findings), 3)]
+        return tmpl.format(n=len(findings), f=findings)
 
 
 # ==================== AGENTS ====================
 
 class BaseAgent:
     """Base agent class with common functionality"""
-    
+
+    __slots__ = ("name", "logger", "start_time", "end_time")
+
     def __init__(self, name: str, logger: AgentLogger):
-        self.name = name
+        self.name = sys.intern(name)
         self.logger = logger
         self.start_time = None
         self.end_time = None
     
-    def _start_task(self, task_name: str):
+    def _start_task(self, task_name: str, session_id: Optional[str] = None):
         """Track task start"""
-        self.start_time = time.time()
-        self.logger.log(self.name, "task_started", {"task": task_name})
-    
-    def _end_task(self, task_name: str):
+        self.start_time = time.perf_counter()
+        self.logger.log(self.name, "task_started", {"task": task_name},
+                        session_id=session_id)
+
+    def _end_task(self, task_name: str, session_id: Optional[str] = None):
         """Track task completion"""
-        self.end_time = time.time()
-        duration = self.end_time - self.start_time
+        self.end_time = time.perf_counter()
+        # Store the raw duration; rounding is display-time work and belongs
+        # to whatever formats the metrics
         self.logger.log(self.name, "task_completed", {
             "task": task_name,
-            "duration_seconds": round(duration, 2)
-        })
+            "duration_seconds": self.end_time - self.start_time
+        }, session_id=session_id)
+
+
+@lru_cache(maxsize=1024)
+def _expand_query(query: str) -> tuple:
+    """Expand a query into its search variants (memoized per query)"""
+    # In production, use LLM to generate diverse queries
+    return (
+        query,
+        f"{query} latest developments",
+        f"{query} expert analysis"
+    )
 
 
 class CoordinatorAgent(BaseAgent):
     """Coordinates the research workflow"""
-    
+
+    __slots__ = ("session_service",)
+
     def __init__(self, logger: AgentLogger, session_service: InMemorySessionService):
         super().__init__("CoordinatorAgent", logger)
         self.session_service = session_service
     
     def plan_research(self, query: str, session_id: str) -> Dict[str, Any]:
         """Plan the research strategy"""
-        self._start_task("research_planning")
-        
+        self._start_task("research_planning", session_id)
+
         # Get session context for informed planning
         context_summary = self.session_service.get_context_summary(session_id)
-        
+
         plan = {
             "query": query,
             "search_queries": self._generate_search_queries(query),
@@ -249,58 +587,58 @@ class CoordinatorAgent(BaseAgent):
             "synthesis_required": True,
             "context": context_summary
         }
-        
-        self.logger.log(self.name, "research_plan_created", plan)
-        self._end_task("research_planning")
+
+        self.logger.log(self.name, "research_plan_created", plan, session_id=session_id)
+        self._end_task("research_planning", session_id)
         
         return plan
     
     def _generate_search_queries(self, query: str) -> List[str]:
         """Generate multiple search queries for comprehensive research"""
-        # In production, use LLM to generate diverse queries
-        return [
-            query,
-            f"{query} latest developments",
-            f"{query} expert analysis"
-        ]
+        return list(_expand_query(query))
 
 
 class ResearcherAgent(BaseAgent):
     """Conducts research using tools"""
-    
+
+    __slots__ = ("search_tool",)
+
     def __init__(self, logger: AgentLogger, search_tool: WebSearchTool):
         super().__init__("ResearcherAgent", logger)
         self.search_tool = search_tool
     
-    def conduct_research(self, plan: Dict[str, Any]) -> List[str]:
-        """Execute research plan"""
-        self._start_task("research_execution")
-        
+    def conduct_research(self, plan: Dict[str, Any], session_id: Optional[str] = None) -> tuple:
+        """Execute research plan, returning (findings, source URLs)"""
+        self._start_task("research_execution", session_id)
+
         findings = []
-        for search_query in plan["search_queries"]:
-            results = self.search_tool.search(search_query, plan["num_sources"])
+        urls = []
+        for results in self.search_tool.batch_search(plan["search_queries"], plan["num_sources"]):
             for result in results:
                 findings.append(f"{result['title']}: {result['snippet']}")
-        
+                urls.append(result["url"])
+
         self.logger.log(self.name, "research_completed", {
             "findings_count": len(findings)
-        })
-        
-        self._end_task("research_execution")
-        return findings
+        }, session_id=session_id)
+
+        self._end_task("research_execution", session_id)
+        return findings, urls
 
 
 class SynthesizerAgent(BaseAgent):
     """Synthesizes research findings"""
-    
+
+    __slots__ = ("synthesis_tool", "memory_bank")
+
     def __init__(self, logger: AgentLogger, synthesis_tool: SynthesisTool, memory_bank: MemoryBank):
         super().__init__("SynthesizerAgent", logger)
         self.synthesis_tool = synthesis_tool
         self.memory_bank = memory_bank
     
-    def synthesize(self, findings: List[str], query: str) -> str:
+    def synthesize(self, findings: List[str], query: str, session_id: Optional[str] = None) -> str:
         """Synthesize findings into final output"""
-        self._start_task("synthesis")
+        self._start_task("synthesis", session_id)
         
         # Retrieve relevant insights from memory
         past_insights = self.memory_bank.retrieve_insights(query)
@@ -315,9 +653,9 @@ class SynthesizerAgent(BaseAgent):
         
         self.logger.log(self.name, "synthesis_completed", {
             "output_length": len(synthesis)
-        })
-        
-        self._end_task("synthesis")
+        }, session_id=session_id)
+
+        self._end_task("synthesis", session_id)
         return synthesis
 
 
@@ -341,46 +679,103 @@ class ResearchAgentSystem:
         self.synthesizer = SynthesizerAgent(self.logger, self.synthesis_tool, self.memory_bank)
     
     def research(self, query: str, session_id: str = None) -> Dict[str, Any]:
-        """Execute full research workflow (Sequential agents)"""
+        """Execute full research workflow for a single query"""
+        return self.research_many([query], session_id)[0]
+
+    def research_many(self, queries: List[str], session_id: str = None) -> List[Dict[str, Any]]:
+        """Run a batch of queries through a three-stage agent pipeline
+
+        Planning, research, and synthesis each run in their own thread,
+        connected by bounded queues: while the researcher fetches query N,
+        the coordinator already plans query N+1, so for steady-state
+        batches wall time approaches the slowest stage instead of the sum
+        of all three. Queues are capped at two items for backpressure.
+        Note that pipelined planning may not see the synthesis of the
+        immediately preceding query in its session context.
+
+        If any stage raises, the remaining items are drained so no stage
+        blocks on a full or empty queue, and the first exception is
+        re-raised once all stages have joined.
+        """
         if not session_id:
             session_id = f"session_{int(time.time())}"
             self.session_service.create_session(session_id)
-        
-        self.logger.log("ResearchAgentSystem", "research_started", {
-            "query": query,
-            "session_id": session_id
-        })
-        
-        # Sequential execution
-        # 1. Coordinator plans
-        plan = self.coordinator.plan_research(query, session_id)
-        
-        # 2. Researcher executes
-        findings = self.researcher.conduct_research(plan)
-        
-        # 3. Synthesizer produces output
-        synthesis = self.synthesizer.synthesize(findings, query)
-        
-        # Store in session
-        context = ResearchContext(
-            query=query,
-            sources=[f["url"] for f in self.search_tool.search(query, 3)],
-            findings=findings[:5],
-            synthesis=synthesis,
-            timestamp=datetime.now().isoformat()
-        )
-        self.session_service.add_to_session(session_id, context)
-        
-        result = {
-            "query": query,
-            "synthesis": synthesis,
-            "sources_count": len(findings),
-            "session_id": session_id
-        }
-        
-        self.logger.log("ResearchAgentSystem", "research_completed", result)
-        
-        return result
+
+        plans: queue.Queue = queue.Queue(maxsize=2)
+        findings_q: queue.Queue = queue.Queue(maxsize=2)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        errors: List[Exception] = []
+
+        def plan_stage():
+            try:
+                for i, query in enumerate(queries):
+                    if errors:
+                        break
+                    self.logger.log("ResearchAgentSystem", "research_started", {
+                        "query": query,
+                        "session_id": session_id
+                    }, session_id=session_id)
+                    plans.put((i, query, self.coordinator.plan_research(query, session_id)))
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                plans.put(None)
+
+        def research_stage():
+            try:
+                while (item := plans.get()) is not None:
+                    if errors:
+                        continue  # keep draining so plan_stage never blocks
+                    i, query, plan = item
+                    findings_q.put((i, query, self.researcher.conduct_research(plan, session_id)))
+            except Exception as exc:
+                errors.append(exc)
+                while plans.get() is not None:
+                    pass
+            finally:
+                findings_q.put(None)
+
+        def synthesis_stage():
+            try:
+                while (item := findings_q.get()) is not None:
+                    if errors:
+                        continue  # keep draining so research_stage never blocks
+                    i, query, (findings, urls) = item
+                    synthesis = self.synthesizer.synthesize(findings, query, session_id)
+
+                    # Store in session, reusing the URLs the researcher already fetched
+                    context = ResearchContext(
+                        query=query,
+                        sources=urls[:3],
+                        findings=findings[:5],
+                        synthesis=synthesis,
+                        timestamp=_fast_isoformat()
+                    )
+                    self.session_service.add_to_session(session_id, context)
+
+                    result = {
+                        "query": query,
+                        "synthesis": synthesis,
+                        "sources_count": len(findings),
+                        "session_id": session_id
+                    }
+                    self.logger.log("ResearchAgentSystem", "research_completed", result,
+                                    session_id=session_id)
+                    results[i] = result
+            except Exception as exc:
+                errors.append(exc)
+                while findings_q.get() is not None:
+                    pass
+
+        stages = [Thread(target=s) for s in (plan_stage, research_stage, synthesis_stage)]
+        for stage in stages:
+            stage.start()
+        for stage in stages:
+            stage.join()
+
+        if errors:
+            raise errors[0]
+        return results
 
 
 # ==================== EVALUATION FRAMEWORK ====================
@@ -393,16 +788,12 @@ class AgentEvaluator:
     
     def evaluate_session(self, system: ResearchAgentSystem, session_id: str) -> Dict[str, Any]:
         """Evaluate agent performance for a session"""
-        traces = self.logger.get_traces()
-        session_traces = [t for t in traces if session_id in str(t.get("details", {}))]
-        
-        # Calculate metrics
-        total_tasks = len([t for t in session_traces if t["action"].endswith("_completed")])
-        total_time = sum([
-            t["details"].get("duration_seconds", 0) 
-            for t in session_traces 
-            if "duration_seconds" in t["details"]
-        ])
+        # Look up the session's trace indices, then reduce over the numeric
+        # columns (compiled by numba when available)
+        indices = self.logger.by_session.get(session_id, [])
+        total_time, total_tasks = _reduce_session_traces(
+            self.logger.durations, self.logger.action_kinds, indices
+        )
         
         history = system.session_service.get_session_history(session_id)
         
@@ -443,10 +834,11 @@ def main():
     ]
     
     print("\n🔍 Starting research queries...\n")
-    
-    for query in queries:
+
+    # The queries flow through the pipelined agents as one batch
+    results = system.research_many(queries, session_id)
+    for query, result in zip(queries, results):
         print(f"Query: {query}")
-        result = system.research(query, session_id)
         print(f"✓ Synthesis: {result['synthesis'][:150]}...")
         print(f"  Sources: {result['sources_count']}")
         print("-" * 60)
@@ -0,0 +1,43 @@
+"""Tests for the research agent pipeline."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from research_agent import ResearchAgentSystem, ResearcherAgent
+
+
+class ResearchManyTest(unittest.TestCase):
+
+    def setUp(self):
+        # Run each test in a scratch directory so the logger's trace file
+        # does not land in the repo
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.system = ResearchAgentSystem()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_results_come_back_in_query_order(self):
+        queries = ["alpha", "beta", "gamma"]
+        results = self.system.research_many(queries, "session_ok")
+        self.assertEqual([r["query"] for r in results], queries)
+        self.assertTrue(all(r["synthesis"] for r in results))
+
+    def test_failing_stage_propagates_instead_of_hanging(self):
+        # A dead stage must still enqueue its sentinel; without it the
+        # downstream stage blocks on get() and research() never returns
+        def boom(agent, plan, session_id=None):
+            raise RuntimeError("search backend down")
+
+        with mock.patch.object(ResearcherAgent, "conduct_research", boom):
+            with self.assertRaisesRegex(RuntimeError, "search backend down"):
+                self.system.research("query", "session_err")
+
+
+if __name__ == "__main__":
+    unittest.main()